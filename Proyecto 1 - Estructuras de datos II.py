@@ -1,6 +1,8 @@
 import os
 import time
 import random
+import statistics
+import threading
 from collections import defaultdict
 
 class Proveedor:
@@ -84,12 +86,19 @@ class ArbolB:
         self.raiz = NodoB(grado_minimo, True)
         self._contador_id = 1
         self._total_proveedores = 0
+        self.depurar = True
+        self._bloqueo_escritura = threading.RLock()
+        self._bloqueo_reconstruccion = threading.Lock()
+        self._reconstruyendo = False
+        self._reconstruccion = None
+        self._operaciones = {'lecturas': 0, 'escrituras': 0}
     
     def verificar_ids(self, max_id=20):
         return [id_esperado for id_esperado in range(1, max_id + 1) 
                 if not self._existe_id(id_esperado)]
     
     def insertar(self, nombre, servicio, calificacion, ubicacion=None, id_proveedor=None):
+        self._operaciones['escrituras'] += 1
         try:
             nombre = str(nombre).strip()
             if not nombre:
@@ -105,34 +114,38 @@ class ArbolB:
                 raise ValueError("La calificación debe ser un número entre 1 y 5")
             ubicacion = str(ubicacion).strip() if ubicacion is not None else "Sin ubicación"
             
-            if id_proveedor is None:
-                id_proveedor = self._generar_id_unico()
-            else:
+            id_explicito = id_proveedor is not None
+            if id_explicito:
                 id_proveedor = int(id_proveedor)
                 if id_proveedor <= 0:
                     raise ValueError("ID debe ser positivo")
-                if self._existe_id(id_proveedor):
-                    raise ValueError(f"El ID {id_proveedor} ya está en uso")
-            
-            proveedor = Proveedor(id_proveedor, nombre, servicio, calificacion, ubicacion)
-            
-            if self.raiz.esta_lleno():
-                nueva_raiz = NodoB(self.grado_minimo, False)
-                nueva_raiz.hijos.append(self.raiz)
-                self._dividir_hijo(nueva_raiz, 0)
-                self.raiz = nueva_raiz
-            
-            self._insertar_no_lleno(self.raiz, proveedor)
-            self._total_proveedores += 1
             
-            if id_proveedor >= self._contador_id:
-                self._contador_id = id_proveedor + 1
+            with self._bloqueo_escritura:
+                if not id_explicito:
+                    id_proveedor = self._generar_id_unico()
+                elif self._existe_id(id_proveedor):
+                    raise ValueError(f"El ID {id_proveedor} ya está en uso")
+                proveedor = Proveedor(id_proveedor, nombre, servicio, calificacion, ubicacion)
+                self._insertar_proveedor(proveedor)
+                self._total_proveedores += 1
+                
+                if id_proveedor >= self._contador_id:
+                    self._contador_id = id_proveedor + 1
                 
             return proveedor.id
         except Exception as e:
             print(f"Error al insertar proveedor: {e}")
             return None
     
+    def _insertar_proveedor(self, proveedor):
+        """Inserta un proveedor ya validado, dividiendo la raíz si está llena"""
+        if self.raiz.esta_lleno():
+            nueva_raiz = NodoB(self.grado_minimo, False)
+            nueva_raiz.hijos.append(self.raiz)
+            self._dividir_hijo(nueva_raiz, 0)
+            self.raiz = nueva_raiz
+        self._insertar_no_lleno(self.raiz, proveedor)
+    
     def _generar_id_unico(self):
         nuevo_id = self._contador_id
         self._contador_id += 1
@@ -153,8 +166,9 @@ class ArbolB:
         return None
     
     def _insertar_no_lleno(self, nodo, proveedor):
+        # Un servicio igual a una clave separadora pertenece al hijo derecho
         idx = 0
-        while idx < len(nodo.claves) and proveedor.servicio > nodo.claves[idx]:
+        while idx < len(nodo.claves) and proveedor.servicio >= nodo.claves[idx]:
             idx += 1
         if nodo.hoja:
             if not nodo.agregar_proveedor(proveedor):
@@ -162,7 +176,7 @@ class ArbolB:
         else:
             if nodo.hijos[idx].esta_lleno():
                 self._dividir_hijo(nodo, idx)
-                if proveedor.servicio > nodo.claves[idx]:
+                if proveedor.servicio >= nodo.claves[idx]:
                     idx += 1
             self._insertar_no_lleno(nodo.hijos[idx], proveedor)
     
@@ -174,8 +188,14 @@ class ArbolB:
         punto_division = self.grado_minimo - 1
         clave_media = hijo.claves[punto_division]
         
-        # Mover claves al nuevo hijo
-        nuevo_hijo.claves = hijo.claves[punto_division + 1:]
+        # Mover claves al nuevo hijo; en una hoja la clave media se copia al padre
+        # y sus proveedores pasan completos al nuevo hijo, donde siguen indexados
+        if hijo.hoja:
+            nuevo_hijo.claves = hijo.claves[punto_division:]
+        else:
+            nuevo_hijo.claves = hijo.claves[punto_division + 1:]
+            nuevo_hijo.hijos = hijo.hijos[punto_division + 1:]
+            hijo.hijos = hijo.hijos[:punto_division + 1]
         hijo.claves = hijo.claves[:punto_division]
         
         # Mover proveedores correspondientes
@@ -183,24 +203,6 @@ class ArbolB:
             if clave in hijo.proveedores:
                 nuevo_hijo.proveedores[clave] = hijo.proveedores.pop(clave)
         
-        # Mover hijos si no es hoja
-        if not hijo.hoja:
-            nuevo_hijo.hijos = hijo.hijos[punto_division + 1:]
-            hijo.hijos = hijo.hijos[:punto_division + 1]
-        
-        # Manejar la clave media
-        if clave_media in hijo.proveedores:
-            if hijo.hoja:
-                # Dividir proveedores de la clave media
-                todos_proveedores = list(hijo.proveedores[clave_media].values())
-                mitad = len(todos_proveedores) // 2 if todos_proveedores else 0
-                hijo.proveedores[clave_media] = {p.id: p for p in todos_proveedores[:mitad]}
-                nuevo_hijo.proveedores[clave_media] = {p.id: p for p in todos_proveedores[mitad:]}
-                if not nuevo_hijo.claves or clave_media < nuevo_hijo.claves[0]:
-                    nuevo_hijo.claves.insert(0, clave_media)
-            else:
-                nuevo_hijo.proveedores[clave_media] = hijo.proveedores.pop(clave_media, {})
-        
         # Actualizar ids_registrados
         hijo.ids_registrados = set()
         nuevo_hijo.ids_registrados = set()
@@ -214,10 +216,12 @@ class ArbolB:
         padre.hijos.insert(indice_hijo + 1, nuevo_hijo)
         
         # Depuración
-        print(f"División completada. Clave media: {clave_media}, "
-              f"Hijo IDs: {hijo.ids_registrados}, Nuevo hijo IDs: {nuevo_hijo.ids_registrados}")
+        if self.depurar:
+            print(f"División completada. Clave media: {clave_media}, "
+                  f"Hijo IDs: {hijo.ids_registrados}, Nuevo hijo IDs: {nuevo_hijo.ids_registrados}")
     
     def buscar_por_servicio(self, servicio, orden='nombre'):
+        self._operaciones['lecturas'] += 1
         try:
             servicio = str(servicio).strip().lower()
             if not servicio:
@@ -240,15 +244,14 @@ class ArbolB:
     
     def _buscar_en_arbol(self, nodo, servicio, resultados):
         try:
+            if nodo.hoja:
+                if servicio in nodo.claves:
+                    resultados.extend(nodo.proveedores.get(servicio, {}).values())
+                return
             idx = 0
-            while idx < len(nodo.claves) and servicio > nodo.claves[idx]:
-                if not nodo.hoja:
-                    self._buscar_en_arbol(nodo.hijos[idx], servicio, resultados)
+            while idx < len(nodo.claves) and servicio >= nodo.claves[idx]:
                 idx += 1
-            if idx < len(nodo.claves) and nodo.claves[idx] == servicio:
-                resultados.extend(nodo.proveedores[servicio].values())
-            if not nodo.hoja:
-                self._buscar_en_arbol(nodo.hijos[idx], servicio, resultados)
+            self._buscar_en_arbol(nodo.hijos[idx], servicio, resultados)
         except Exception as e:
             print(f"Error en búsqueda recursiva: {e}")
     
@@ -285,20 +288,21 @@ class ArbolB:
             print(f"Error en recorrido inorden: {e}")
     
     def eliminar_proveedor(self, id_proveedor):
+        self._operaciones['escrituras'] += 1
         try:
             id_proveedor = int(id_proveedor)
             if id_proveedor <= 0:
                 print("Error: ID debe ser positivo")
                 return False
-            encontrado = self._eliminar_en_arbol(self.raiz, id_proveedor)
-            if encontrado:
-                self._total_proveedores -= 1
-                if not self.raiz.hoja and len(self.raiz.claves) == 0 and len(self.raiz.hijos) == 1:
-                    self.raiz = self.raiz.hijos[0]
-                return True
-            else:
-                print(f"Proveedor con ID {id_proveedor} no encontrado")
-                return False
+            with self._bloqueo_escritura:
+                encontrado = self._eliminar_en_arbol(self.raiz, id_proveedor)
+                if encontrado:
+                    self._total_proveedores -= 1
+                    if not self.raiz.hoja and len(self.raiz.claves) == 0 and len(self.raiz.hijos) == 1:
+                        self.raiz = self.raiz.hijos[0]
+                    return True
+            print(f"Proveedor con ID {id_proveedor} no encontrado")
+            return False
         except (ValueError, TypeError):
             print("Error: ID debe ser un número entero positivo")
             return False
@@ -348,14 +352,15 @@ class ArbolB:
             if 'servicio' in kwargs:
                 nuevo_servicio = str(kwargs['servicio']).strip().lower()
                 if nuevo_servicio and nuevo_servicio != proveedor.servicio:
-                    self.eliminar_proveedor(id_proveedor)
-                    self.insertar(
-                        proveedor.nombre, 
-                        nuevo_servicio, 
-                        proveedor.calificacion, 
-                        proveedor.ubicacion, 
-                        id_proveedor
-                    )
+                    with self._bloqueo_escritura:
+                        self.eliminar_proveedor(id_proveedor)
+                        self.insertar(
+                            proveedor.nombre,
+                            nuevo_servicio,
+                            proveedor.calificacion,
+                            proveedor.ubicacion,
+                            id_proveedor
+                        )
                     return True
             if 'calificacion' in kwargs:
                 try:
@@ -429,6 +434,221 @@ class ArbolB:
             return 1
         return 1 + self._calcular_profundidad(nodo.hijos[0])
 
+    def historial_suficiente(self, minimo_operaciones=20):
+        return self._operaciones['lecturas'] + self._operaciones['escrituras'] >= minimo_operaciones
+
+    def mezcla_operaciones(self, lecturas_por_defecto=0.8, minimo_operaciones=20):
+        """Proporción de lecturas observada; usa el valor por defecto hasta tener suficiente historial"""
+        if not self.historial_suficiente(minimo_operaciones):
+            return lecturas_por_defecto
+        total = self._operaciones['lecturas'] + self._operaciones['escrituras']
+        return self._operaciones['lecturas'] / total
+
+    def reconstruir(self, nuevo_grado, en_segundo_plano=True):
+        """Migra el árbol a un nuevo grado mínimo y lo reemplaza de forma atómica.
+
+        Las búsquedas siguen atendiéndose sobre la raíz anterior mientras se
+        construye la nueva; las escrituras esperan a que termine el cambio.
+        Devuelve False si ya había una reconstrucción en curso; en primer plano
+        devuelve además si la migración terminó correctamente.
+        """
+        if nuevo_grado < 2:
+            raise ValueError("El grado mínimo debe ser al menos 2")
+        with self._bloqueo_reconstruccion:
+            if self._reconstruyendo:
+                print("Error: Ya hay una reconstrucción en curso")
+                return False
+            self._reconstruyendo = True
+            if en_segundo_plano:
+                self._reconstruccion = threading.Thread(
+                    target=self._ejecutar_reconstruccion, args=(nuevo_grado,), daemon=True
+                )
+                try:
+                    self._reconstruccion.start()
+                except Exception:
+                    self._reconstruyendo = False
+                    raise
+                return True
+        return self._ejecutar_reconstruccion(nuevo_grado)
+
+    def _ejecutar_reconstruccion(self, nuevo_grado):
+        try:
+            return self._migrar_a_grado(nuevo_grado)
+        finally:
+            self._reconstruyendo = False
+
+    def reconstruyendo(self):
+        return self._reconstruyendo
+
+    def esperar_reconstruccion(self, timeout=None):
+        if self._reconstruccion is not None:
+            self._reconstruccion.join(timeout)
+        return not self.reconstruyendo()
+
+    def _recolectar_proveedores(self, nodo, resultados):
+        """Reúne los proveedores de todos los nodos, estén o no indexados en sus claves"""
+        for proveedores_servicio in nodo.proveedores.values():
+            resultados.update(proveedores_servicio)
+        for hijo in nodo.hijos:
+            self._recolectar_proveedores(hijo, resultados)
+        return resultados
+
+    def _migrar_a_grado(self, nuevo_grado):
+        try:
+            with self._bloqueo_escritura:
+                originales = self._recolectar_proveedores(self.raiz, {})
+                if len(originales) != self._total_proveedores:
+                    raise ValueError(f"El árbol contiene {len(originales)} proveedores pero "
+                                     f"se esperaban {self._total_proveedores}")
+                temporal = ArbolB(nuevo_grado)
+                temporal.depurar = False
+                for id_proveedor in sorted(originales):
+                    temporal._insertar_proveedor(originales[id_proveedor])
+                copiados = temporal._recolectar_proveedores(temporal.raiz, {})
+                if copiados.keys() != originales.keys():
+                    raise ValueError(f"La copia contiene {len(copiados)} proveedores de "
+                                     f"{len(originales)}, se conserva el árbol actual")
+                # Los lectores sólo ven lo que encuentra la búsqueda por servicio
+                por_servicio = defaultdict(set)
+                for proveedor in originales.values():
+                    por_servicio[proveedor.servicio].add(proveedor.id)
+                for servicio, ids in por_servicio.items():
+                    encontrados = {p.id for p in temporal.buscar_por_servicio(servicio)}
+                    if encontrados != ids:
+                        raise ValueError(f"La búsqueda de '{servicio}' en la copia encuentra "
+                                         f"{len(encontrados)} de {len(ids)} proveedores, "
+                                         "se conserva el árbol actual")
+                # Una sola asignación de la raíz: los lectores ven el árbol viejo o el nuevo
+                self.grado_minimo = nuevo_grado
+                self.raiz = temporal.raiz
+                return True
+        except Exception as e:
+            print(f"Error al reconstruir el árbol: {e}")
+            return False
+
+    def ajustar_grado(self, grados_candidatos=(2, 3, 4, 5, 8, 16), operaciones=2000,
+                      proporcion_lecturas=None, aplicar=True, semilla=None,
+                      repeticiones=5, margen=0.10):
+        """Calibra cada grado candidato con la mezcla de operaciones y elige el grado.
+
+        Cada grado recibe una pasada de calentamiento y varias pruebas cronometradas
+        y se comparan sus medianas. Se conserva el grado actual salvo que algún otro
+        lo supere en más del margen indicado; entre los que lo superan se elige el
+        más cercano al actual (y, a igual distancia, el menor).
+        """
+        try:
+            if proporcion_lecturas is not None:
+                origen_proporcion = 'indicada'
+            elif self.historial_suficiente():
+                origen_proporcion = 'observada'
+                proporcion_lecturas = self.mezcla_operaciones()
+            else:
+                origen_proporcion = 'por_defecto'
+                proporcion_lecturas = self.mezcla_operaciones()
+            proporcion_lecturas = float(proporcion_lecturas)
+            if not (0 <= proporcion_lecturas <= 1):
+                raise ValueError("La proporción de lecturas debe estar entre 0 y 1")
+            repeticiones = int(repeticiones)
+            if repeticiones < 1:
+                raise ValueError("Debe haber al menos una repetición por grado")
+            margen = float(margen)
+            if margen < 0:
+                raise ValueError("El margen no puede ser negativo")
+            grado_actual = self.grado_minimo
+            grados_candidatos = sorted({int(g) for g in grados_candidatos if int(g) >= 2} | {grado_actual})
+
+            if semilla is None:
+                semilla = random.randrange(2 ** 32)
+
+            proveedores = list(self._recolectar_proveedores(self.raiz, {}).values())
+            if not proveedores:
+                return {'error': 'No hay proveedores para calibrar el grado'}
+            servicios = sorted({p.servicio for p in proveedores})
+
+            pruebas = {grado: self._crear_arbol_prueba(grado, proveedores) for grado in grados_candidatos}
+            for prueba in pruebas.values():
+                self._ejecutar_prueba(prueba, servicios, operaciones, proporcion_lecturas, semilla)
+
+            # Las repeticiones se intercalan entre grados para repartir el ruido del sistema
+            tiempos = {grado: [] for grado in grados_candidatos}
+            for _ in range(repeticiones):
+                for grado, prueba in pruebas.items():
+                    tiempos[grado].append(self._ejecutar_prueba(
+                        prueba, servicios, operaciones, proporcion_lecturas, semilla
+                    ))
+
+            mediciones = []
+            for grado in grados_candidatos:
+                ops = [operaciones / t if t > 0 else float('inf') for t in tiempos[grado]]
+                mediana = statistics.median(ops)
+                mediciones.append({
+                    'grado': grado,
+                    'tiempo': statistics.median(tiempos[grado]),
+                    'ops_por_segundo': mediana,
+                    'ops_min': min(ops),
+                    'ops_max': max(ops),
+                    'dispersion': (max(ops) - min(ops)) / mediana if mediana else 0.0,
+                    'profundidad': pruebas[grado]._calcular_profundidad(pruebas[grado].raiz)
+                })
+            actual = next(m for m in mediciones if m['grado'] == grado_actual)
+            umbral = actual['ops_por_segundo'] * (1 + margen)
+            superiores = [m for m in mediciones if m['ops_por_segundo'] > umbral]
+            if superiores:
+                mejor = min(superiores, key=lambda m: (abs(m['grado'] - grado_actual), m['grado']))
+            else:
+                mejor = actual
+            mejora = mejor['ops_por_segundo'] / actual['ops_por_segundo'] if actual['ops_por_segundo'] else 1.0
+
+            decision = {
+                'grado_actual': grado_actual,
+                'grado_elegido': mejor['grado'],
+                'mejora': mejora,
+                'margen': margen,
+                'total_proveedores': len(proveedores),
+                'servicios_distintos': len(servicios),
+                'proporcion_lecturas': proporcion_lecturas,
+                'origen_proporcion': origen_proporcion,
+                'operaciones': operaciones,
+                'repeticiones': repeticiones,
+                'mediciones': mediciones,
+                'reconstruccion_iniciada': False
+            }
+            if aplicar and mejor['grado'] != grado_actual:
+                decision['reconstruccion_iniciada'] = self.reconstruir(mejor['grado'])
+            return decision
+        except Exception as e:
+            print(f"Error al ajustar el grado: {e}")
+            return {'error': str(e)}
+
+    def _crear_arbol_prueba(self, grado, proveedores):
+        prueba = ArbolB(grado)
+        prueba.depurar = False
+        for proveedor in proveedores:
+            prueba._insertar_proveedor(proveedor)
+        prueba._total_proveedores = len(proveedores)
+        prueba._contador_id = self._contador_id
+        return prueba
+
+    def _ejecutar_prueba(self, prueba, servicios, operaciones, proporcion_lecturas, semilla):
+        """Ejecuta la mezcla de operaciones sobre un árbol de prueba y devuelve el tiempo empleado"""
+        aleatorio = random.Random(semilla)
+        # Las escrituras alternan altas y bajas para mantener estable el tamaño
+        pendientes = []
+        inicio = time.perf_counter()
+        for _ in range(operaciones):
+            if aleatorio.random() < proporcion_lecturas:
+                prueba.buscar_por_servicio(aleatorio.choice(servicios))
+            elif pendientes:
+                prueba.eliminar_proveedor(pendientes.pop())
+            else:
+                pendientes.append(prueba.insertar(
+                    "Calibración", aleatorio.choice(servicios), 3.0, "Sin ubicación"
+                ))
+        tiempo = time.perf_counter() - inicio
+        for id_proveedor in pendientes:
+            prueba.eliminar_proveedor(id_proveedor)
+        return tiempo
+
 def mostrar_menu():
     print("\n=== Sistema de Gestión de Proveedores con Árbol B ===")
     print("1. Registrar nuevo proveedor")
@@ -440,7 +660,8 @@ def mostrar_menu():
     print("7. Mostrar estadísticas del sistema")
     print("8. Cargar datos de prueba")
     print("9. Verificar IDs de proveedores")
-    print("10. Salir")
+    print("10. Ajustar grado del árbol automáticamente")
+    print("11. Salir")
 
 def registrar_proveedor(arbol):
     print("\n--- Registro de Nuevo Proveedor ---")
@@ -551,6 +772,8 @@ def cargar_datos_prueba(arbol):
     nombres = ['Juan Pérez', 'María García', 'Carlos López', 'Ana Martínez', 'Luis Rodríguez', 
               'Sofía Hernández', 'Pedro González', 'Laura Díaz', 'Miguel Sánchez', 'Elena Ramírez']
     ubicaciones = ['Ciudad A', 'Ciudad B', 'Ciudad C', 'Ciudad D', 'Ciudad E']
+    # La carga masiva no forma parte de la carga de trabajo que calibra el ajuste de grado
+    operaciones_previas = dict(arbol._operaciones)
     
     for id_proveedor in range(1, 21):
         intentos = 0
@@ -582,6 +805,7 @@ def cargar_datos_prueba(arbol):
                 print(f"✅ Proveedor {id_proveedor} registrado con datos por defecto")
     
     arbol._contador_id = max(arbol._contador_id, 21)
+    arbol._operaciones = operaciones_previas
     print("\n✅ Finalizó la carga de 20 proveedores de prueba con IDs del 1 al 20")
     
     faltantes = arbol.verificar_ids(20)
@@ -603,13 +827,60 @@ def verificar_ids_proveedores(arbol):
     except ValueError:
         print("Error: Ingrese un número válido")
 
+def ajustar_grado_arbol(arbol):
+    print("\n--- Ajuste Automático del Grado del Árbol B ---")
+    if arbol.reconstruyendo():
+        print("⚠ Hay una reconstrucción en curso, intente más tarde")
+        return
+    print(f"Grado mínimo actual: {arbol.grado_minimo}")
+    print("Calibrando grados candidatos...")
+    resultado = arbol.ajustar_grado()
+    if 'error' in resultado:
+        print(f"\n❌ Error: {resultado['error']}")
+        return
+    if resultado['origen_proporcion'] == 'por_defecto':
+        print(f"Proporción de lecturas: {resultado['proporcion_lecturas']:.0%} "
+              "(valor por defecto, aún no hay suficientes operaciones registradas)")
+    else:
+        print(f"Proporción de lecturas {resultado['origen_proporcion']}: {resultado['proporcion_lecturas']:.0%}")
+    print(f"\n📊 Mediciones ({resultado['repeticiones']} pruebas de {resultado['operaciones']} operaciones, "
+          f"{resultado['total_proveedores']} proveedores, "
+          f"{resultado['servicios_distintos']} servicios):")
+    for medicion in resultado['mediciones']:
+        marca = " ⭐" if medicion['grado'] == resultado['grado_elegido'] else ""
+        print(f"- Grado {medicion['grado']}: {medicion['ops_por_segundo']:.0f} ops/s (mediana, "
+              f"rango {medicion['ops_min']:.0f}-{medicion['ops_max']:.0f}, dispersión {medicion['dispersion']:.0%}), "
+              f"profundidad {medicion['profundidad']}{marca}")
+    if resultado['grado_elegido'] == resultado['grado_actual']:
+        print(f"\n✅ Se conserva el grado actual ({resultado['grado_actual']}): ningún otro grado "
+              f"lo supera en más del {resultado['margen']:.0%}")
+        return
+    print(f"\n🔄 Migrando del grado {resultado['grado_actual']} al grado {resultado['grado_elegido']} "
+          f"({resultado['mejora']:.2f} veces más rápido); las búsquedas siguen disponibles...")
+    if not resultado['reconstruccion_iniciada']:
+        print(f"❌ No se pudo iniciar la reconstrucción, el árbol conserva el grado {resultado['grado_actual']}")
+    elif not arbol.esperar_reconstruccion(timeout=30):
+        print(f"⚠ La reconstrucción continúa en segundo plano; el árbol mantiene el grado "
+              f"{resultado['grado_actual']} hasta que termine")
+    elif arbol.grado_minimo != resultado['grado_elegido']:
+        print(f"❌ La reconstrucción falló, el árbol conserva el grado {arbol.grado_minimo}")
+    else:
+        print(f"✅ Árbol reconstruido con grado mínimo {arbol.grado_minimo}")
+
 def main():
     try:
         os.system('cls')
         print("=== Configuración Inicial del Árbol B ===")
+        ajuste_automatico = False
         while True:
             try:
-                grado = int(input("Ingrese el grado mínimo del árbol B (recomendado 3): "))
+                grado = input("Ingrese el grado mínimo del árbol B (recomendado 3, vacío para ajuste automático): ").strip()
+                if not grado:
+                    grado = 3
+                    ajuste_automatico = True
+                    print("Se usará el grado 3 y se ajustará automáticamente al cargar datos de prueba")
+                    break
+                grado = int(grado)
                 if grado >= 2:
                     break
                 print("El grado mínimo debe ser al menos 2")
@@ -649,10 +920,15 @@ def main():
                 elif opcion == '8':
                     os.system('cls')
                     cargar_datos_prueba(arbol)
+                    if ajuste_automatico:
+                        ajustar_grado_arbol(arbol)
                 elif opcion == '9':
                     os.system('cls')
                     verificar_ids_proveedores(arbol)
                 elif opcion == '10':
+                    os.system('cls')
+                    ajustar_grado_arbol(arbol)
+                elif opcion == '11':
                     os.system('cls')
                     print("\n¡Gracias por usar el sistema!")
                     break
@@ -671,4 +947,5 @@ def main():
         print("Por favor, reinicie el programa.")
 
 
-main()
\ No newline at end of file
+if __name__ == '__main__':
+    main()
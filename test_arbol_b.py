@@ -0,0 +1,120 @@
+import importlib.util
+import os
+import threading
+import unittest
+
+_RUTA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Proyecto 1 - Estructuras de datos II.py")
+_spec = importlib.util.spec_from_file_location("proyecto_arbol_b", _RUTA)
+proyecto = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(proyecto)
+
+SERVICIOS = ['albañil', 'carpintero', 'diseñador', 'electricista',
+             'jardinero', 'pintor', 'plomero', 'programador']
+
+
+def crear_arbol(grado=3, cantidad=60):
+    arbol = proyecto.ArbolB(grado)
+    arbol.depurar = False
+    for i in range(1, cantidad + 1):
+        arbol.insertar(f"Proveedor {i}", SERVICIOS[(i * 7) % len(SERVICIOS)], 4.0, "Ciudad A", i)
+    return arbol
+
+
+def ids_por_servicio(arbol):
+    return {servicio: sorted(p.id for p in arbol.buscar_por_servicio(servicio)) for servicio in SERVICIOS}
+
+
+class TestReconstruccion(unittest.TestCase):
+    def test_reconstruir_conserva_busquedas_por_servicio(self):
+        arbol = crear_arbol(grado=3)
+        esperados = ids_por_servicio(arbol)
+        self.assertEqual(sum(len(ids) for ids in esperados.values()), 60)
+        for grado in (2, 4, 2):
+            self.assertTrue(arbol.reconstruir(grado, en_segundo_plano=False))
+            self.assertEqual(arbol.grado_minimo, grado)
+            self.assertEqual(ids_por_servicio(arbol), esperados)
+            self.assertEqual(arbol._total_proveedores, 60)
+
+    def test_segunda_reconstruccion_devuelve_false(self):
+        arbol = crear_arbol()
+        # Con las escrituras bloqueadas la primera reconstrucción no puede terminar
+        arbol._bloqueo_escritura.acquire()
+        try:
+            self.assertTrue(arbol.reconstruir(5))
+            self.assertTrue(arbol.reconstruyendo())
+            self.assertFalse(arbol.reconstruir(4))
+            self.assertFalse(arbol.reconstruir(4, en_segundo_plano=False))
+        finally:
+            arbol._bloqueo_escritura.release()
+        self.assertTrue(arbol.esperar_reconstruccion(timeout=10))
+        self.assertEqual(arbol.grado_minimo, 5)
+
+    def test_reconstruir_grado_invalido(self):
+        arbol = crear_arbol()
+        with self.assertRaises(ValueError):
+            arbol.reconstruir(1)
+        self.assertFalse(arbol.reconstruyendo())
+
+    def test_busquedas_durante_reconstruccion(self):
+        arbol = crear_arbol(cantidad=200)
+        esperados = ids_por_servicio(arbol)
+        errores = []
+        detener = threading.Event()
+
+        def lector():
+            while not detener.is_set():
+                if ids_por_servicio(arbol) != esperados:
+                    errores.append(arbol.grado_minimo)
+
+        hilo = threading.Thread(target=lector)
+        hilo.start()
+        try:
+            for grado in (2, 6, 3):
+                self.assertTrue(arbol.reconstruir(grado))
+                self.assertTrue(arbol.esperar_reconstruccion(timeout=10))
+        finally:
+            detener.set()
+            hilo.join()
+        self.assertEqual(errores, [])
+
+
+class TestAjusteGrado(unittest.TestCase):
+    def test_mezcla_operaciones_con_muchas_escrituras(self):
+        arbol = crear_arbol(cantidad=0)
+        self.assertFalse(arbol.historial_suficiente())
+        self.assertEqual(arbol.mezcla_operaciones(), 0.8)
+        for i in range(100):
+            arbol.insertar(f"Proveedor {i}", "plomero", 4.0)
+        for _ in range(5):
+            arbol.buscar_por_servicio("plomero")
+        self.assertTrue(arbol.historial_suficiente())
+        self.assertAlmostEqual(arbol.mezcla_operaciones(), 5 / 105)
+
+    def test_ajustar_grado_informa_decision_y_mediciones(self):
+        arbol = crear_arbol()
+        resultado = arbol.ajustar_grado(grados_candidatos=(2, 4), operaciones=200,
+                                        proporcion_lecturas=0.5, aplicar=False,
+                                        semilla=7, repeticiones=3)
+        for clave in ('grado_actual', 'grado_elegido', 'mejora', 'margen', 'total_proveedores',
+                      'servicios_distintos', 'proporcion_lecturas', 'origen_proporcion',
+                      'operaciones', 'repeticiones', 'mediciones', 'reconstruccion_iniciada'):
+            self.assertIn(clave, resultado)
+        self.assertEqual(resultado['grado_actual'], 3)
+        self.assertEqual(resultado['origen_proporcion'], 'indicada')
+        self.assertFalse(resultado['reconstruccion_iniciada'])
+        self.assertEqual(arbol.grado_minimo, 3)
+        self.assertEqual([m['grado'] for m in resultado['mediciones']], [2, 3, 4])
+        for medicion in resultado['mediciones']:
+            for clave in ('tiempo', 'ops_por_segundo', 'ops_min', 'ops_max', 'dispersion', 'profundidad'):
+                self.assertIn(clave, medicion)
+            self.assertLessEqual(medicion['ops_min'], medicion['ops_por_segundo'])
+            self.assertLessEqual(medicion['ops_por_segundo'], medicion['ops_max'])
+        actual = next(m for m in resultado['mediciones'] if m['grado'] == 3)
+        elegido = next(m for m in resultado['mediciones'] if m['grado'] == resultado['grado_elegido'])
+        if resultado['grado_elegido'] != 3:
+            self.assertGreater(elegido['ops_por_segundo'], actual['ops_por_segundo'] * (1 + resultado['margen']))
+        self.assertEqual(ids_por_servicio(arbol), ids_por_servicio(crear_arbol()))
+
+
+if __name__ == '__main__':
+    unittest.main()